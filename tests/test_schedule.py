@@ -6,6 +6,7 @@ import logging
 import os
 import unittest
 from datetime import date
+from functools import cache
 
 import pandas as pd
 
@@ -22,7 +23,18 @@ logger = logging.getLogger(__name__)
 
 test_data_dir = os.path.join(os.path.dirname(__file__), "testdata")
 test_json_path = os.path.join(test_data_dir, "test_schedule.json")
-test_df = pd.read_json(test_json_path)
+
+
+@cache
+def get_test_df() -> pd.DataFrame:
+    """
+    Load the reference test schedule, parsing it on first use
+    so test collection does not pay for the read
+
+    :return: reference schedule dataframe
+    """
+    return pd.read_json(test_json_path)
+
 
 program = Program(
     pi_name="Stein",
@@ -47,7 +59,7 @@ class TestSchedule(unittest.TestCase):
         :return: None
         """
         logger.info("Testing the validation with a test json")
-        validate_schedule_df(test_df)
+        validate_schedule_df(get_test_df())
 
     def test_generate_schedule(self):
         """
@@ -74,7 +86,9 @@ class TestSchedule(unittest.TestCase):
         validate_target_visibility(schedule)
 
         comp = pd.read_json(schedule.to_json())  # pylint: disable=no-member
-        self.assertEqual(test_df.to_json(), comp.to_json())  # pylint: disable=no-member
+        self.assertEqual(
+            get_test_df().to_json(), comp.to_json()  # pylint: disable=no-member
+        )
 
         schedule = schedule_ra_dec(
             too=SummerRaDecToO(
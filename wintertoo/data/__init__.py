@@ -4,6 +4,7 @@ Central module for general data and telescope constants
 
 import json
 import typing
+from functools import cache
 from pathlib import Path
 from typing import Literal
 
@@ -14,12 +15,49 @@ import pandas as pd
 data_dir = Path(__file__).parent.resolve()
 
 summer_fields_path = data_dir.joinpath("summer_fields.txt")
-summer_fields = pd.read_csv(summer_fields_path, sep=r"\s+")
 
 winter_fields_path = data_dir.joinpath("winter_fields.txt")
-all_winter_fields = pd.read_csv(winter_fields_path, sep=r"\s+")
-winter_fields = all_winter_fields[all_winter_fields["ID"] < 41170]
-winter_secondary_fields = all_winter_fields[all_winter_fields["ID"] >= 41170]
+
+
+@cache
+def get_summer_fields() -> pd.DataFrame:
+    """
+    Get the summer field table, parsing it on first use
+
+    :return: dataframe of summer fields
+    """
+    return pd.read_csv(summer_fields_path, sep=r"\s+")
+
+
+@cache
+def get_all_winter_fields() -> pd.DataFrame:
+    """
+    Get the full winter field table, parsing it on first use
+
+    :return: dataframe of all winter fields
+    """
+    return pd.read_csv(winter_fields_path, sep=r"\s+")
+
+
+def get_winter_fields() -> pd.DataFrame:
+    """
+    Get the primary winter field table
+
+    :return: dataframe of primary winter fields
+    """
+    all_winter_fields = get_all_winter_fields()
+    return all_winter_fields[all_winter_fields["ID"] < 41170]
+
+
+def get_winter_secondary_fields() -> pd.DataFrame:
+    """
+    Get the secondary winter field table
+
+    :return: dataframe of secondary winter fields
+    """
+    all_winter_fields = get_all_winter_fields()
+    return all_winter_fields[all_winter_fields["ID"] >= 41170]
+
 
 SummerFilters = Literal["u", "g", "r", "i"]
 
@@ -41,8 +79,16 @@ PROGRAM_DB_HOST = "jagati.caltech.edu"
 
 too_schedule_config_path = data_dir.joinpath("observing_request_schema.json")
 
-with open(too_schedule_config_path, "rb") as f:
-    too_db_schedule_config = json.load(f)
+
+@cache
+def get_too_schedule_config() -> dict:
+    """
+    Get the ToO database schema, reading it on first use
+
+    :return: schema dictionary
+    """
+    with open(too_schedule_config_path, "rb") as f:
+        return json.load(f)
 
 
 def get_default_value(key: str):
@@ -52,10 +98,24 @@ def get_default_value(key: str):
     :param key: Key to check
     :return: default value
     """
-    return too_db_schedule_config["properties"][key]["default"]
+    return get_too_schedule_config()["properties"][key]["default"]
+
+
+@cache
+def get_palomar_loc() -> coords.EarthLocation:
+    """
+    Get the location of Palomar Observatory, resolving it on first use
+
+    :return: location of Palomar Observatory
+    """
+    return coords.EarthLocation.of_site("Palomar", refresh_cache=True)
 
 
-# define location of Palomar Observatory
-PALOMAR_LOC = coords.EarthLocation.of_site("Palomar", refresh_cache=True)
+@cache
+def get_palomar_observer() -> astroplan.Observer:
+    """
+    Get an observer at Palomar Observatory
 
-palomar_observer = astroplan.Observer(location=PALOMAR_LOC)
+    :return: Palomar observer
+    """
+    return astroplan.Observer(location=get_palomar_loc())
@@ -4,6 +4,7 @@ Module for database functions
 
 import getpass
 import secrets
+from functools import lru_cache
 
 import bcrypt
 import numpy as np
@@ -13,9 +14,10 @@ from sqlalchemy import create_engine
 
 from wintertoo.data import PROGRAM_DB_HOST
 from wintertoo.errors import WinterCredentialsError
+from wintertoo.models import Program
 
 
-#
+@lru_cache
 def get_engine(
     db_user: str = None,
     db_password: str = None,
@@ -23,7 +25,9 @@ def get_engine(
     db_name: str = "summer",
 ):
     """
-    Get engine for database
+    Get engine for database.
+    Engines are cached per (user, host, database) so that repeated calls
+    reuse the same connection pool rather than opening fresh connections.
 
     :param db_user: Database user
     :param db_password: Database password
@@ -34,6 +38,7 @@ def get_engine(
     return create_engine(
         f"postgresql+psycopg://{db_user}:{db_password}" f"@{db_host}/{db_name}",
         future=True,
+        pool_pre_ping=True,
     )
 
 
@@ -64,13 +69,19 @@ def get_program_details(  # pylint: disable=R0913,R0914,R0917
             f"Enter password for program_db_user {program_db_user}: "
         )
 
+    # Only pull the columns the Program model actually uses,
+    # and filter by program name server-side
+    colnames = list(Program.model_fields)
+
     with psycopg.connect(  # pylint: disable=not-context-manager
         f"dbname='{program_db_name}' user={program_db_user} "
         f"password={program_db_password} host={program_db_host}",
     ) as conn:
         conn.read_only = True
-        with conn.execute("SELECT * FROM programs") as cursor:
-            colnames = [desc[0] for desc in cursor.description]
+        with conn.execute(
+            f"SELECT {', '.join(colnames)} FROM programs WHERE progname = %s",
+            (program_name,),
+        ) as cursor:
             data = pd.DataFrame(cursor.fetchall(), columns=colnames)
 
     name_match = []
@@ -13,8 +13,8 @@ from matplotlib.axes import Axes
 from wintertoo.data import (
     SUMMER_BASE_WIDTH,
     WINTER_BASE_WIDTH,
-    summer_fields,
-    winter_fields,
+    get_summer_fields,
+    get_winter_fields,
 )
 
 logger = logging.getLogger(__name__)
@@ -27,9 +27,9 @@ def get_fields(summer: bool = False) -> pd.DataFrame:
     :return: field dataframe
     """
     if summer:
-        field_df = summer_fields
+        field_df = get_summer_fields()
     else:
-        field_df = winter_fields
+        field_df = get_winter_fields()
     return field_df
 
 
@@ -180,12 +180,8 @@ def get_best_field(
 
     sky_pos = SkyCoord(ra_deg, dec_deg, unit="deg")
 
-    dists = np.array(
-        [
-            sky_pos.separation(SkyCoord(x["RA"], x["Dec"], unit="deg")).value
-            for _, x in res.iterrows()
-        ]
-    )
+    field_centers = SkyCoord(res["RA"].to_numpy(), res["Dec"].to_numpy(), unit="deg")
+    dists = sky_pos.separation(field_centers).value
 
     closest_mask = dists == np.min(dists)
 
@@ -6,7 +6,7 @@ from typing import Optional
 
 from astropy import units as u
 from astropy.time import Time
-from pydantic import AliasChoices, BaseModel, Field, model_validator
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, model_validator
 
 from wintertoo.data import DEFAULT_IMAGE_TYPE, MAX_TARGNAME_LEN, WinterImageTypes
 from wintertoo.errors import WinterValidationError
@@ -32,12 +32,12 @@ class ProgramImageQuery(BaseModel):
     start_date: int = Field(
         title="Start date for images",
         default=None,
-        examples=[get_date(Time.now() - 30.0 * u.day), "20230601"],
+        examples=[20230601, 20230615],
     )
     end_date: int = Field(
         title="End date for images",
         default=None,
-        examples=[get_date(Time.now() - 30.0 * u.day), get_date(Time.now())],
+        examples=[20230615, 20230701],
     )
     image_type: WinterImageTypes = Field(
         default=DEFAULT_IMAGE_TYPE,
@@ -75,6 +75,8 @@ class ProgramImageQuery(BaseModel):
 
         return self
 
+    model_config = ConfigDict(extra="forbid")
+
 
 class TargetImageQuery(ProgramImageQuery):
     """
@@ -69,11 +69,11 @@ class ToORequest(BaseModel):
     start_time_mjd: Optional[float] = Field(
         default=None,
         title="ToO validity start (MJD)",
-        example=Time.now().mjd,
+        examples=[62000.0],
     )
     end_time_mjd: Optional[float] = Field(
         default=None,
-        example=Time.now().mjd + 1,
+        examples=[62001.0],
         title="ToO validity end (MJD)",
     )
     max_airmass: Optional[float] = Field(
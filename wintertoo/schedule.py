@@ -3,8 +3,10 @@ Module for generating schedules
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 
+import numpy as np
 import pandas as pd
 
 from wintertoo.data import get_default_value
@@ -25,6 +27,26 @@ from wintertoo.validate import validate_schedule_df
 logger = logging.getLogger(__name__)
 
 
+def export_schedule_to_csv(schedule: pd.DataFrame, csv_save_file: str):
+    """
+    Export a schedule to csv, using the faster pyarrow writer when available
+
+    :param schedule: schedule to export
+    :param csv_save_file: path to export to
+    :return: None
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        pa_csv.write_csv(
+            pa.Table.from_pandas(schedule, preserve_index=False), csv_save_file
+        )
+    except ImportError:
+        schedule.to_csv(csv_save_file, index=False)
+
+
 def make_schedule(
     toos: list[FullTooRequest],
     program: Program,
@@ -42,32 +64,35 @@ def make_schedule(
     all_entries = []
 
     for too in toos:
-        for filter_name in too.filters:
-            for _ in range(too.n_repetitions):
-                new = {
-                    "targName": too.target_name,
-                    "raDeg": too.ra_deg,
-                    "decDeg": too.dec_deg,
-                    "fieldID": too.field_id,
-                    "filter": filter_name,
-                    "visitExpTime": too.total_exposure_time,
-                    "singleExpTime": too.single_exposure_time,
-                    "priority": too.target_priority,
-                    "progPI": program.pi_name,
-                    "progName": program.progname,
-                    "progID": program.progid,
-                    "validStart": too.start_time_mjd,
-                    "validStop": too.end_time_mjd,
-                    "observed": False,
-                    "maxAirmass": too.max_airmass,
-                    "ditherNumber": too.n_dither,
-                    "ditherStepSize": too.dither_distance,
-                    "bestDetector": too.use_best_detector,
-                }
-                all_entries.append(new)
-
-    schedule = pd.DataFrame(all_entries)
-    schedule = schedule.astype({"observed": bool})
+        # One row per filter and repetition, with explicitly-typed columns
+        # so pandas never has to infer dtypes
+        n_rows = len(too.filters) * too.n_repetitions
+        new = pd.DataFrame(
+            {
+                "targName": np.full(n_rows, too.target_name, dtype=object),
+                "raDeg": np.full(n_rows, too.ra_deg, dtype=float),
+                "decDeg": np.full(n_rows, too.dec_deg, dtype=float),
+                "fieldID": np.full(n_rows, too.field_id, dtype=int),
+                "filter": np.repeat(too.filters, too.n_repetitions),
+                "visitExpTime": np.full(n_rows, too.total_exposure_time, dtype=float),
+                "singleExpTime": np.full(n_rows, too.single_exposure_time, dtype=float),
+                "priority": np.full(n_rows, too.target_priority, dtype=float),
+                "progPI": np.full(n_rows, program.pi_name, dtype=object),
+                "progName": np.full(n_rows, program.progname, dtype=object),
+                "progID": np.full(n_rows, program.progid, dtype=int),
+                "validStart": np.full(n_rows, too.start_time_mjd, dtype=float),
+                "validStop": np.full(n_rows, too.end_time_mjd, dtype=float),
+                "observed": np.full(n_rows, False, dtype=bool),
+                "maxAirmass": np.full(n_rows, too.max_airmass, dtype=float),
+                "ditherNumber": np.full(n_rows, too.n_dither, dtype=int),
+                "ditherStepSize": np.full(n_rows, too.dither_distance, dtype=float),
+                "bestDetector": np.full(n_rows, too.use_best_detector, dtype=bool),
+            },
+            copy=False,
+        )
+        all_entries.append(new)
+
+    schedule = pd.concat(all_entries, ignore_index=True)
 
     schedule["obsHistID"] = range(len(schedule))
 
@@ -75,7 +100,7 @@ def make_schedule(
 
     if csv_save_file is not None:
         logger.info(f"Saving schedule to {csv_save_file}")
-        schedule.to_csv(csv_save_file, index=False)
+        export_schedule_to_csv(schedule, csv_save_file)
     return schedule
 
 
@@ -171,36 +196,48 @@ def schedule_field(
     return schedule
 
 
+def schedule_too(
+    too: AllTooClasses,
+    program: Program,
+) -> pd.DataFrame:
+    """
+    Generate a schedule for a single ToO request of either flavour
+
+    :param too: a field or ra/dec ToO request
+    :param program: program details
+    :return: a schedule dataframe
+    """
+    if isinstance(too, (SummerFieldToO, WinterFieldToO)):
+        return schedule_field(
+            too=too,
+            program=program,
+        )
+    if isinstance(too, (SummerRaDecToO, WinterRaDecToO)):
+        return schedule_ra_dec(
+            too=too,
+            program=program,
+        )
+
+    err = f"Unrecognised type {type(too)} for {too}"
+    logger.error(err)
+    raise WinterValidationError(err)
+
+
 def concat_toos(
     requests: list[AllTooClasses],
     program: Program,
 ) -> pd.DataFrame:
     """
-    Provides a concatenated schedule, composed of multiple individual requests
+    Provides a concatenated schedule, composed of multiple individual requests.
+    The individual requests are scheduled in parallel threads,
+    with the output order matching the input order.
 
     :param requests: list of requests
     :param program: program
     :return: schedule dataframe
     """
-    schedule = []
-
-    for too in requests:
-        if isinstance(too, (SummerFieldToO, WinterFieldToO)):
-            res = schedule_field(
-                too=too,
-                program=program,
-            )
-        elif isinstance(too, (SummerRaDecToO, WinterRaDecToO)):
-            res = schedule_ra_dec(
-                too=too,
-                program=program,
-            )
-        else:
-            err = f"Unrecognised type {type(too)} for {too}"
-            logger.error(err)
-            raise WinterValidationError(err)
-
-        schedule.append(res)
+    with ThreadPoolExecutor() as executor:
+        schedule = list(executor.map(lambda too: schedule_too(too, program), requests))
 
     schedule = pd.concat(schedule, ignore_index=True)
     schedule["obsHistID"] = range(len(schedule))
@@ -17,12 +17,15 @@ logger = logging.getLogger(__name__)
 FILE_DATE_FORMAT = "%Y_%m_%d_%H_%M_%S"
 
 
-def get_db_file_name(program_name: str, date: Optional[datetime] = None) -> str:
+def get_db_file_name(
+    program_name: str, date: Optional[datetime] = None, suffix: str = "db"
+) -> str:
     """
     Function to get the name of a database file
 
     :param program_name: Name of program
     :param date: Date to use
+    :param suffix: File suffix to use
     :return: String of database file name
     """
 
@@ -31,7 +34,7 @@ def get_db_file_name(program_name: str, date: Optional[datetime] = None) -> str:
 
     strf_time = date.strftime(FILE_DATE_FORMAT)
 
-    return f"request_{program_name}_{strf_time}.db"
+    return f"request_{program_name}_{strf_time}.{suffix}"
 
 
 def export_schedule_to_sqlitedb(schedule: pd.DataFrame, base_save_path: str) -> Path:
@@ -60,8 +63,51 @@ def export_schedule_to_sqlitedb(schedule: pd.DataFrame, base_save_path: str) ->
         logger.error(err)
         raise ValueError(err)
 
-    engine = create_engine(f"sqlite:///{save_path}?check_same_thread=False", echo=True)
-    schedule.to_sql(sqlite_table, engine, if_exists="replace", index=False)
+    engine = create_engine(f"sqlite:///{save_path}?check_same_thread=False")
+
+    # Keep bound parameters per multi-row INSERT below SQLite's
+    # default host-parameter limit of 999 (raised only in sqlite >= 3.32)
+    chunksize = max(1, 999 // len(schedule.columns))
+
+    schedule.to_sql(
+        sqlite_table,
+        engine,
+        if_exists="replace",
+        index=False,
+        method="multi",
+        chunksize=chunksize,
+    )
+
+    return save_path
+
+
+def export_schedule_to_parquet(schedule: pd.DataFrame, base_save_path: str) -> Path:
+    """
+    Function to export a schedule to a parquet file.
+    Faster to write and read than the sqlite export, and preserves dtypes,
+    but requires the optional pyarrow dependency.
+
+    :param schedule: schedule to export
+    :param base_save_path: directory to save to
+    :return: path of exported file
+    """
+    # Validate format of schedule using json schema
+    validate_schedule_df(schedule)
+
+    program_name = str(schedule["progName"].iloc[0])
+
+    schedule_file_name = get_db_file_name(program_name=program_name, suffix="parquet")
+
+    save_path = Path(base_save_path).joinpath(schedule_file_name)
+
+    logger.info(f"Saving to {save_path}")
+
+    if not save_path.parent.exists():
+        err = f"Parent directory {save_path.parent} does not exist"
+        logger.error(err)
+        raise ValueError(err)
+
+    schedule.to_parquet(save_path, index=False)
 
     return save_path
 
@@ -8,13 +8,12 @@ import logging
 
 import astropy.time
 import numpy as np
-import pandas as pd
 from astropy import units as u
 from astropy.coordinates import AltAz, SkyCoord
 from astropy.time import Time
 from astropy.utils.masked import Masked
 
-from wintertoo.data import PALOMAR_LOC, palomar_observer
+from wintertoo.data import get_palomar_loc, get_palomar_observer
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +30,7 @@ def get_alt_az(times_mjd: list, ra: float, dec: float) -> tuple:
     """
     loc = SkyCoord(ra=ra, dec=dec, frame="icrs")
     time = Time(times_mjd, format="mjd")
-    altaz = loc.transform_to(AltAz(obstime=time, location=PALOMAR_LOC))
+    altaz = loc.transform_to(AltAz(obstime=time, location=get_palomar_loc()))
     degs = SkyCoord(altaz.az, altaz.alt, frame="icrs")
     alt_array = degs.dec.degree
     az_array = degs.ra.degree
@@ -52,6 +51,8 @@ def up_tonight(time_mjd: astropy.time.Time, ra: str, dec: str) -> tuple[bool, st
     loc = SkyCoord(ra=ra, dec=dec, frame="icrs")
     time = Time(time_mjd, format="mjd")
 
+    palomar_observer = get_palomar_observer()
+
     # Rise/fade can fail if target is close to a bin edge
     sun_rise = palomar_observer.sun_rise_time(time, which="previous")
     if isinstance(sun_rise.value, Masked):
@@ -68,23 +69,19 @@ def up_tonight(time_mjd: astropy.time.Time, ra: str, dec: str) -> tuple[bool, st
         time_array = np.linspace(sun_set.jd, sun_set.jd + night, 100)
 
     altaz = loc.transform_to(
-        AltAz(obstime=Time(time_array, format="jd"), location=PALOMAR_LOC)
+        AltAz(obstime=Time(time_array, format="jd"), location=get_palomar_loc())
     )
-    df = pd.DataFrame(data={"time": time_array, "alt": altaz.alt})
-    df = df[df["alt"] >= MINIMUM_ELEVATION]
+    times_above = time_array[altaz.alt.deg >= MINIMUM_ELEVATION]
 
     time_up = 0
-    if len(df) > 0:
-        try:
-            time_up = df["time"].iloc[-1] - df["time"].iloc[0]
-        except KeyError:
-            pass
+    if len(times_above) > 0:
+        time_up = times_above[-1] - times_above[0]
 
     if time_up > 0:
         is_available = (
             f"Object is up between UTC "
-            f'{Time(df["time"].iloc[0], format="jd").isot} '
-            f'and {Time(df["time"].iloc[-1], format="jd").isot}'
+            f'{Time(times_above[0], format="jd").isot} '
+            f'and {Time(times_above[-1], format="jd").isot}'
         )
         avail_bool = True
     else:
@@ -101,4 +98,4 @@ def get_date(time: Time) -> int:
     :param time: Time object
     :return: date as an integer
     """
-    return int(str(time).split(" ", maxsplit=1)[0].replace("-", ""))
+    return int(time.strftime("%Y%m%d"))
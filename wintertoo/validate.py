@@ -2,16 +2,17 @@
 Module for validating ToO requests
 """
 
-import json
 import logging
+from functools import cache
 
 import astropy.time
 import pandas as pd
 from astropy import units as u
+from astropy.coordinates.erfa_astrom import ErfaAstromInterpolator, erfa_astrom
 from astropy.time import Time
-from jsonschema import validate
+from jsonschema import Draft7Validator
 
-from wintertoo.data import PROGRAM_DB_HOST, SUMMER_FILTERS, too_db_schedule_config
+from wintertoo.data import PROGRAM_DB_HOST, SUMMER_FILTERS, get_too_schedule_config
 from wintertoo.database import get_program_details
 from wintertoo.errors import WinterCredentialsError, WinterValidationError
 from wintertoo.models import Program
@@ -62,6 +63,16 @@ def get_and_validate_program_details(  # pylint: disable=R0913,R0917
     return Program(**data.iloc[0].to_dict())
 
 
+@cache
+def get_schedule_validator() -> Draft7Validator:
+    """
+    Get a validator for the ToO database schema.
+    The schema is only compiled once, on first use.
+    :return: compiled schema validator
+    """
+    return Draft7Validator(get_too_schedule_config())
+
+
 def validate_schedule_json(data: dict):
     """
     Validates that a schedule json matches the ToO database schema.
@@ -69,15 +80,26 @@ def validate_schedule_json(data: dict):
     :param data: data to validate
     :return: None
     """
-    try:
-        validate(data, schema=too_db_schedule_config)
-        logger.debug("Successfully validated schema")
-    except WinterValidationError as exc:
+    error = next(get_schedule_validator().iter_errors(data), None)
+
+    if error is not None:
         logger.error(
             "Error with JSON schema validation, input data not formatted correctly."
         )
-        logger.error(exc)
-        raise WinterValidationError(exc) from exc
+        logger.error(error.message)
+        raise WinterValidationError(error.message) from error
+
+    logger.debug("Successfully validated schema")
+
+
+@cache
+def get_schedule_array_validator() -> Draft7Validator:
+    """
+    Get a validator for a full array of schedule entries.
+    The schema is only compiled once, on first use.
+    :return: compiled schema validator
+    """
+    return Draft7Validator({"type": "array", "items": get_too_schedule_config()})
 
 
 def validate_schedule_df(df: pd.DataFrame):
@@ -86,9 +108,14 @@ def validate_schedule_df(df: pd.DataFrame):
     :param df: dataframe
     :return: None
     """
-    for _, row in df.iterrows():
-        json.loads(row.to_json())
-        validate_schedule_json(json.loads(row.to_json()))
+    records = df.to_dict(orient="records")
+    error = next(get_schedule_array_validator().iter_errors(records), None)
+
+    if error is not None:
+        row = error.absolute_path[0] if error.absolute_path else "?"
+        err = f"Schedule row {row} failed schema validation: {error.message}"
+        logger.error(err)
+        raise WinterValidationError(err) from error
 
 
 def validate_target_visibility(schedule: pd.DataFrame):
@@ -98,14 +125,22 @@ def validate_target_visibility(schedule: pd.DataFrame):
     :param schedule: Schedule to check
     :return: None
     """
-    for _, row in schedule.iterrows():
-        ra = row["raDeg"] * u.deg
-        dec = row["decDeg"] * u.deg
-
-        for time_mjd in [row["validStart"], row["validStop"]]:
-            t_mjd = Time(time_mjd, format="mjd")
-
-            is_up, _ = up_tonight(time_mjd=t_mjd, ra=ra, dec=dec)
+    # Rows sharing a target and date only need to be checked once
+    unique_targets = pd.concat(
+        [
+            schedule[["raDeg", "decDeg", time_key]].rename(columns={time_key: "mjd"})
+            for time_key in ["validStart", "validStop"]
+        ]
+    ).drop_duplicates()
+
+    # One array-valued Time is much cheaper than one Time object per row
+    times = Time(unique_targets["mjd"].to_numpy(), format="mjd")
+
+    with erfa_astrom.set(ErfaAstromInterpolator(300 * u.s)):
+        for t_mjd, (_, row) in zip(times, unique_targets.iterrows()):
+            is_up, _ = up_tonight(
+                time_mjd=t_mjd, ra=row["raDeg"] * u.deg, dec=row["decDeg"] * u.deg
+            )
 
             if not is_up:
                 err = (
@@ -151,16 +186,16 @@ def validate_target_priority(schedule: pd.DataFrame, max_priority: float):
     :return: None.
     """
 
-    for _, row in schedule.iterrows():
-        target_priority = float(row["priority"])
+    target_priorities = schedule["priority"].astype(float)
+    too_high = target_priorities > max_priority
 
-        if target_priority > max_priority:
-            err = (
-                f"Target priority ({target_priority} exceeds maximum allowed value "
-                f"of {max_priority}. "
-            )
-            logger.error(err)
-            raise WinterValidationError(err)
+    if too_high.any():
+        err = (
+            f"Target priority ({target_priorities[too_high].iloc[0]} "
+            f"exceeds maximum allowed value of {max_priority}. "
+        )
+        logger.error(err)
+        raise WinterValidationError(err)
 
 
 def validate_filter(filter_name: str):
@@ -180,12 +215,16 @@ def validate_target_pi(schedule: pd.DataFrame, prog_pi: str):
     :param prog_pi: true program PI
     :return: None.
     """
-    for _, row in schedule.iterrows():
-        pi = row["progPI"]
-        if pi != prog_pi:
-            err = f"Pi '{pi}' does not match database PI for program {row['progName']}"
-            logger.error(err)
-            raise WinterValidationError()
+    mismatched = schedule["progPI"] != prog_pi
+
+    if mismatched.any():
+        row = schedule[mismatched].iloc[0]
+        err = (
+            f"Pi '{row['progPI']}' does not match "
+            f"database PI for program {row['progName']}"
+        )
+        logger.error(err)
+        raise WinterValidationError()
 
 
 def validate_target_dates(
@@ -203,32 +242,37 @@ def validate_target_dates(
     :param program_end_date: end date of program
     :return: None
     """
-    for _, row in schedule.iterrows():
-        start_time = Time(row["validStart"], format="mjd")
-        stop_time = Time(row["validStop"], format="mjd")
+    start_mjds = schedule["validStart"].astype(float).to_numpy()
+    stop_mjds = schedule["validStop"].astype(float).to_numpy()
 
-        err = None
+    wrong_order = start_mjds > stop_mjds
+    too_early = start_mjds < program_start_date.mjd
+    too_late = stop_mjds > program_end_date.mjd
 
-        if start_time > stop_time:
-            err = (
-                f"Start time '{start_time.isot}' is after stop time '{stop_time.isot}'."
-            )
+    err = None
 
-        elif start_time < program_start_date:
-            err = (
-                f"Start time '{start_time.isot}' is before "
-                f"program start date '{program_start_date.isot}'"
-            )
+    if wrong_order.any():
+        start_time = Time(start_mjds[wrong_order][0], format="mjd")
+        stop_time = Time(stop_mjds[wrong_order][0], format="mjd")
+        err = f"Start time '{start_time.isot}' is after stop time '{stop_time.isot}'."
 
-        elif stop_time > program_end_date:
-            err = (
-                f"Stop time '{start_time.isot}' is after "
-                f"program end date '{program_end_date.isot}'"
-            )
+    elif too_early.any():
+        start_time = Time(start_mjds[too_early][0], format="mjd")
+        err = (
+            f"Start time '{start_time.isot}' is before "
+            f"program start date '{program_start_date.isot}'"
+        )
+
+    elif too_late.any():
+        stop_time = Time(stop_mjds[too_late][0], format="mjd")
+        err = (
+            f"Stop time '{stop_time.isot}' is after "
+            f"program end date '{program_end_date.isot}'"
+        )
 
-        if err is not None:
-            logger.error(err)
-            raise WinterValidationError(err)
+    if err is not None:
+        logger.error(err)
+        raise WinterValidationError(err)
 
 
 def validate_time_allocation(